@@ -4,6 +4,14 @@ import os
 import streamlit as st
 from rag_contrats.core.retriever import RAGRetriever
 from rag_contrats.core.generator import generate_answer
+from rag_contrats.core.config import RELOAD_INTERVAL
+
+
+@st.cache_resource
+def get_retriever() -> RAGRetriever:
+    # One long-lived retriever per server: it hot-reloads new index snapshots
+    # in the background instead of being rebuilt on every query.
+    return RAGRetriever(reload_interval=RELOAD_INTERVAL)
 
 
 st.set_page_config(page_title=" Système RAG ", layout="wide")
@@ -14,7 +22,7 @@ top_k = st.slider(" Nombre de chunks à récupérer", 1, 10, 5)
 
 if st.button("Lancer la recherche") and query:
     with st.spinner("Recherche et génération en cours..."):
-        retriever = RAGRetriever()
+        retriever = get_retriever()
         results = retriever.retrieve(query, top_k)
 
         chunks = [res[0] for res in results]
@@ -1,8 +1,29 @@
+from bisect import bisect_right
 from collections.abc import Iterable
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import Any, Dict, List
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from .config import CHUNK_SIZE, CHUNK_OVERLAP
+from tokenizers import Tokenizer
+from transformers import AutoTokenizer, PreTrainedTokenizerBase
+from .config import (
+    CHUNK_SIZE,
+    CHUNK_OVERLAP,
+    CHUNK_MAX_TOKENS,
+    CHUNK_OVERLAP_TOKENS,
+    CHUNK_WORKERS,
+    CHUNK_PARALLEL_MIN_CHARS,
+    EMBEDDING_MODEL_ID,
+)
+
+#: Preferred split points for the token-aware splitter, strongest first: the
+#: separators of :func:`chunk_texts`, with all sentence ends on one rank.
+_SEPARATORS = ("\n\n", "\n", ".!?", " ")
+
+#: Tokenizers report this sentinel when no maximum length is configured.
+_UNSET_MAX_LENGTH = 1_000_000
 
 
 def chunk_texts(docs: Iterable[Dict[str, Any]]) -> List[Dict[str, str]]:
@@ -62,3 +83,285 @@ def chunk_texts(docs: Iterable[Dict[str, Any]]) -> List[Dict[str, str]]:
         for chunk in chunks:
             all_chunks.append({"doc_id": doc["doc_id"], "text": chunk})
     return all_chunks
+
+
+# --------------------------------------------------------------------------- #
+# Token-aware chunking                                                        #
+# --------------------------------------------------------------------------- #
+@lru_cache(maxsize=None)
+def _load_tokenizer(tokenizer_id: str) -> PreTrainedTokenizerBase:
+    # Cached per process, so each pool worker loads the tokenizer only once.
+    return AutoTokenizer.from_pretrained(tokenizer_id)
+
+
+@lru_cache(maxsize=None)
+def _load_backend(tokenizer_id: str) -> Tokenizer:
+    """Private copy of the Rust tokenizer with truncation and padding disabled.
+
+    ``tokenizer.json`` files may ship with truncation or padding enabled,
+    which the ``transformers`` wrapper only overrides for its own calls.  Left
+    as is, encoding a whole document would silently keep its first tokens.
+    """
+    tokenizer = _load_tokenizer(tokenizer_id)
+    if not tokenizer.is_fast:
+        raise ValueError(
+            f"Tokenizer {tokenizer_id!r} has no fast (Rust) implementation; "
+            "character offsets are unavailable"
+        )
+    backend = Tokenizer.from_str(tokenizer.backend_tokenizer.to_str())
+    backend.no_truncation()
+    backend.no_padding()
+    return backend
+
+
+def _token_budget(tokenizer: PreTrainedTokenizerBase, max_tokens: int | None) -> int:
+    """Number of content tokens that fit in one sequence, special tokens aside."""
+    model_max_length = tokenizer.model_max_length
+    if model_max_length >= _UNSET_MAX_LENGTH:
+        if max_tokens is None:
+            raise ValueError(
+                f"Tokenizer {tokenizer.name_or_path!r} does not define a maximum "
+                "sequence length; set CHUNK_MAX_TOKENS explicitly"
+            )
+    elif max_tokens is None:
+        max_tokens = model_max_length
+    elif max_tokens > model_max_length:
+        raise ValueError(
+            f"max_tokens ({max_tokens}) exceeds the maximum sequence length of "
+            f"{tokenizer.name_or_path!r} ({model_max_length}); the embedder would "
+            "truncate such chunks"
+        )
+    return max_tokens - tokenizer.num_special_tokens_to_add(pair=False)
+
+
+def _trim(text: str, start: int, end: int) -> tuple[int, int]:
+    """Shrink the character span ``[start, end)`` to exclude outer whitespace."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _boundary_rank(
+    text: str,
+    offsets: List[tuple[int, int]],
+    cut: int,
+    limit: int = len(_SEPARATORS),
+) -> int:
+    """Rank in :data:`_SEPARATORS` of the boundary before token *cut*.
+
+    Only ranks below *limit* are tested; *limit* is returned when none match.
+    """
+    # Token spans may include the surrounding whitespace (SentencePiece puts
+    # it in the next token), so trim both tokens before looking at the gap.
+    prev_end = _trim(text, *offsets[cut - 1])[1]
+    next_start = _trim(text, *offsets[cut])[0]
+    gap, last_char = text[prev_end:next_start], text[prev_end - 1 : prev_end]
+    for rank, sep in enumerate(_SEPARATORS[:limit]):
+        if (last_char != "" and last_char in sep) if sep == ".!?" else (sep in gap):
+            return rank
+    return limit
+
+
+def _find_cut(
+    text: str,
+    offsets: List[tuple[int, int]],
+    start: int,
+    end: int,
+) -> int:
+    """Move the exclusive token index *end* back to the best natural boundary.
+
+    Only the second half of the window is searched so that chunks never end
+    up much shorter than the budget.  Returns *end* unchanged if no separator
+    is found.
+    """
+    lowest = start + max((end - start) // 2, 1)
+    best_cut, best_rank = end, len(_SEPARATORS)
+    for cut in range(end, lowest - 1, -1):
+        rank = _boundary_rank(text, offsets, cut, limit=best_rank)
+        if rank < best_rank:
+            best_cut, best_rank = cut, rank
+        if best_rank == 0:
+            break
+    return best_cut
+
+
+def _overlap_start(
+    text: str,
+    offsets: List[tuple[int, int]],
+    lowest: int,
+    end: int,
+) -> int:
+    """First token in ``[lowest, end)`` that starts a unit as strong as the cut.
+
+    A chunk cut at a sentence end makes the next chunk start at a sentence
+    start inside the overlap window, a paragraph cut at a paragraph start,
+    and so on.  Returns *end* (no overlap) if no such boundary exists.
+    """
+    cut_rank = _boundary_rank(text, offsets, end)
+    for start in range(lowest, end):
+        if _boundary_rank(text, offsets, start, limit=cut_rank + 1) <= cut_rank:
+            return start
+    return end
+
+
+def _chunk_document(
+    doc: Dict[str, Any],
+    tokenizer_id: str,
+    max_tokens: int | None,
+    overlap: int,
+) -> List[Dict[str, Any]]:
+    """Split a single document; executed inside the pool workers."""
+    tokenizer = _load_tokenizer(tokenizer_id)
+    budget = _token_budget(tokenizer, max_tokens)
+    if not 0 <= overlap < budget:
+        raise ValueError(
+            f"Token overlap ({overlap}) must be smaller than the chunk budget ({budget})"
+        )
+
+    text: str = doc["text"]
+    pages = doc.get("pages") or []
+    page_starts = [offset for _, offset in pages]
+
+    def page_at(char: int) -> int | None:
+        i = bisect_right(page_starts, char) - 1
+        return pages[i][0] if i >= 0 else None
+
+    # Talk to the Rust tokenizer directly: the Python wrapper adds about 50%
+    # to the cost of the many small calls below.
+    backend = _load_backend(tokenizer_id)
+    offsets = backend.encode(text, add_special_tokens=False).offsets
+
+    chunks: List[Dict[str, Any]] = []
+    n_tokens, start = len(offsets), 0
+    while start < n_tokens:
+        end = min(start + budget, n_tokens)
+        if end < n_tokens:
+            end = _find_cut(text, offsets, start, end)
+
+        # Re-tokenising the substring may differ slightly from the in-context
+        # tokens at the edges; drop the overflow and cut again until it fits.
+        while True:
+            start_char, end_char = _trim(text, offsets[start][0], offsets[end - 1][1])
+            n_chunk_tokens = len(
+                backend.encode(text[start_char:end_char], add_special_tokens=False)
+            )
+            if n_chunk_tokens <= budget or end - start == 1:
+                break
+            end = max(end - (n_chunk_tokens - budget), start + 1)
+            end = _find_cut(text, offsets, start, end)
+
+        if start_char < end_char:
+            chunks.append(
+                {
+                    "doc_id": doc["doc_id"],
+                    "text": text[start_char:end_char],
+                    "page_start": page_at(start_char),
+                    "page_end": page_at(max(end_char - 1, start_char)),
+                    "start_char": start_char,
+                    "end_char": end_char,
+                    "n_tokens": n_chunk_tokens,
+                }
+            )
+
+        if end >= n_tokens:
+            break
+        start = _overlap_start(text, offsets, max(end - overlap, start + 1), end)
+    return chunks
+
+
+def chunk_texts_by_tokens(
+    docs: Iterable[Dict[str, Any]],
+    tokenizer_id: str = EMBEDDING_MODEL_ID,
+    max_tokens: int | None = CHUNK_MAX_TOKENS,
+    overlap: int = CHUNK_OVERLAP_TOKENS,
+    workers: int | None = CHUNK_WORKERS,
+    min_parallel_chars: int = CHUNK_PARALLEL_MIN_CHARS,
+) -> List[Dict[str, Any]]:
+    """Split documents into chunks sized in tokens of the embedding model.
+
+    Unlike :func:`chunk_texts`, chunk length is measured with the tokenizer of
+    the embedder, so every chunk fills the model's context as much as possible
+    without ever being truncated at embedding time.  Each document is
+    tokenised once; windows of at most the token budget are then cut at the
+    strongest natural boundary (paragraph, line, sentence, word) found in the
+    second half of the window.
+
+    Parameters
+    ----------
+    docs
+        An iterable of dictionaries with ``"doc_id"`` and ``"text"`` keys, as
+        returned by :func:`core.loader.load_pdfs`.  An optional ``"pages"``
+        list of ``(page_number, start_offset)`` pairs is used to attach page
+        numbers to each chunk.
+    tokenizer_id
+        Hugging Face identifier of the tokenizer.  Defaults to
+        :data:`core.config.EMBEDDING_MODEL_ID`.
+    max_tokens
+        Maximum sequence length, special tokens included.  ``None`` uses the
+        tokenizer's ``model_max_length``; larger values are rejected.
+    overlap
+        Maximum number of tokens shared by consecutive chunks of the same
+        document.  The overlap starts at a boundary at least as strong as the
+        one the previous chunk was cut at, so it may be shorter or empty.
+    workers
+        Size of the process pool.  ``None`` uses one process per CPU; ``1``
+        runs everything in the current process.
+    min_parallel_chars
+        Corpora with fewer characters than this are chunked in the current
+        process regardless of *workers*, since starting the pool would cost
+        more than it saves.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        A flat list of chunk dictionaries, in document order, with keys
+
+        * ``"doc_id"``                    – identifier of the source document
+        * ``"text"``                      – the chunk text
+        * ``"page_start"``, ``"page_end"`` – first and last page covered, or
+          ``None`` when the document has no page information
+        * ``"start_char"``, ``"end_char"`` – character offsets of the chunk in
+          the document text
+        * ``"n_tokens"``                  – length in tokens, special tokens
+          excluded
+
+    Raises
+    ------
+    ValueError
+        If the tokenizer has no maximum length and *max_tokens* is ``None``,
+        if *max_tokens* exceeds the tokenizer's ``model_max_length``, or if
+        *overlap* does not fit in the token budget.
+
+    Notes
+    -----
+    * A *fast* (Rust-backed) tokenizer is required for character offsets.
+    * Parallelism is per document: the pool only pays off for corpora with
+      several large documents.  Workers are *spawned* rather than forked and
+      each loads the tokenizer once.  A spawned worker re-imports the
+      caller's ``__main__`` module, so scripts using the pool must not import
+      :mod:`core.embedder` at top level (it loads the model on import);
+      ``scripts/build_index.py`` imports it inside ``main()``.
+    * See ``scripts/bench_chunker.py`` for a throughput comparison with
+      :func:`chunk_texts`.
+    """
+    split = partial(
+        _chunk_document,
+        tokenizer_id=tokenizer_id,
+        max_tokens=max_tokens,
+        overlap=overlap,
+    )
+
+    docs = list(docs)
+    n_chars = sum(len(doc["text"]) for doc in docs)
+    if workers == 1 or len(docs) < 2 or n_chars < min_parallel_chars:
+        per_doc = [split(doc) for doc in docs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            per_doc = list(pool.map(split, docs))
+
+    return [chunk for chunks in per_doc for chunk in chunks]
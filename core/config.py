@@ -8,8 +8,13 @@ CHUNKS_PATH = "data/chunks.pkl"
 EMBEDDINGS_PATH = "data/chunks_embeddings.npy"
 
 # Chunking
+CHUNK_MODE = "chars"  # "chars" (CHUNK_SIZE characters) or "tokens" (embedding tokenizer)
 CHUNK_SIZE = 500
 CHUNK_OVERLAP = 20
+CHUNK_MAX_TOKENS = None  # None -> the embedding model's max sequence length
+CHUNK_OVERLAP_TOKENS = 16
+CHUNK_WORKERS = 4  # None -> one process per CPU
+CHUNK_PARALLEL_MIN_CHARS = 5_000_000  # smaller corpora are chunked in-process
 
 # Embedding model
 EMBEDDING_MODEL_ID = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
@@ -24,3 +29,8 @@ OPENAI_MODEL_NAME = ""
 INDEX_PATH = "../data/index/faiss_index.index"
 METADATA_PATH = "../data/index/faiss_metadata.pkl"
 EMBEDDING_DIM = 384  
+
+# Versioned index snapshots (see core/snapshots.py)
+SNAPSHOT_DIR = "../data/index"
+RELOAD_INTERVAL = 5.0  # seconds between checks for a newly published snapshot
+SNAPSHOT_KEEP = 3
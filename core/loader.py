@@ -1,12 +1,12 @@
 from collections.abc import Iterable
-from typing import Dict, List
+from typing import Any, Dict, List
 from pathlib import Path
 
 from PyPDF2 import PdfReader
 from .config import PDF_DIR
 
 
-def load_pdfs(pdf_dir: str | Path = PDF_DIR) -> List[Dict[str, str]]:
+def load_pdfs(pdf_dir: str | Path = PDF_DIR) -> List[Dict[str, Any]]:
     """Read every “*.pdf” file in a directory and return their textual contents.
 
     Each PDF is parsed page-by-page with :class:`PyPDF2.PdfReader`; the extracted
@@ -24,11 +24,14 @@ def load_pdfs(pdf_dir: str | Path = PDF_DIR) -> List[Dict[str, str]]:
 
     Returns
     -------
-    list[dict[str, str]]
+    list[dict[str, Any]]
         A list where each element is a dictionary with keys
 
         * ``"doc_id"`` – the PDF file name (including extension)  
-        * ``"text"``   – a single string containing all extracted page texts
+        * ``"text"``   – a single string containing all extracted page texts  
+        * ``"pages"``  – a list of ``(page_number, start_offset)`` pairs giving
+          the 1-based page number and the character offset in ``"text"`` at
+          which each extracted page begins
 
     Raises
     ------
@@ -59,15 +62,22 @@ def load_pdfs(pdf_dir: str | Path = PDF_DIR) -> List[Dict[str, str]]:
     if not pdf_path.exists():
         raise FileNotFoundError(f"Directory {pdf_path!s} does not exist")
 
-    docs: List[Dict[str, str]] = []
+    docs: List[Dict[str, Any]] = []
     for pdf_file in pdf_path.glob("*.pdf"):
         reader = PdfReader(str(pdf_file))
-        text = "\n".join(
-            page_text
-            for page in reader.pages
-            if (page_text := page.extract_text())  # skip non-text pages
+        page_texts: List[str] = []
+        pages: List[tuple[int, int]] = []
+        offset = 0
+        for page_number, page in enumerate(reader.pages, start=1):
+            page_text = page.extract_text()
+            if not page_text:  # skip non-text pages
+                continue
+            pages.append((page_number, offset))
+            page_texts.append(page_text)
+            offset += len(page_text) + 1  # account for the "\n" separator
+        docs.append(
+            {"doc_id": pdf_file.name, "text": "\n".join(page_texts), "pages": pages}
         )
-        docs.append({"doc_id": pdf_file.name, "text": text})
 
     if not docs:
         raise ValueError(f"No PDF files found in directory {pdf_path!s}")
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import logging
+import threading
 from typing import List, Tuple, Dict
 
 import numpy as np
 from .vector_store import FaissIndex
 from .embedder import embed
-from .config import INDEX_PATH, METADATA_PATH
+from .snapshots import current_version, load_snapshot
+from .config import INDEX_PATH, METADATA_PATH, SNAPSHOT_DIR
+
+logger = logging.getLogger(__name__)
 
 
 class RAGRetriever:
@@ -24,14 +29,35 @@ class RAGRetriever:
         models).
     index_path
         File path to the serialized FAISS index (e.g. ``"faiss.index"``).
+        When *index_path* or *metadata_path* is given, these flat files are
+        loaded and snapshots are not used.
     metadata_path
         File path to the NumPy ``.npy`` file storing per-vector metadata
         (typically a list of chunk dictionaries).
+    snapshot_dir
+        Root of the versioned snapshots written by
+        :func:`core.snapshots.publish_snapshot`.  Defaults to
+        :data:`core.config.SNAPSHOT_DIR`; if nothing has been published there
+        yet, :data:`core.config.INDEX_PATH` / :data:`core.config.METADATA_PATH`
+        are loaded instead.
+    reload_interval
+        Seconds between two checks of the ``CURRENT`` pointer by a background
+        watcher.  Hot reloading is off unless this is set.
+
+    Raises
+    ------
+    ValueError
+        If flat index files are combined with *snapshot_dir* or
+        *reload_interval*.
+    FileNotFoundError
+        If an explicit *snapshot_dir* holds no published snapshot.
 
     Attributes
     ----------
     index : FaissIndex
         In-memory FAISS index ready for similarity search.
+    version : str or None
+        Name of the snapshot currently served, ``None`` for legacy files.
 
     Notes
     -----
@@ -40,16 +66,103 @@ class RAGRetriever:
       loading or a separate warm-up step.
     * The current implementation always places the index on CPU.  Move it to
       GPU with ``faiss.index_cpu_to_gpu`` if your deployment stack supports it.
+    * With *reload_interval* set, new snapshots are loaded on a daemon thread
+      and then published by a single reference assignment (RCU-style):
+      :meth:`retrieve` takes its own reference to ``self.index`` up front, so
+      in-flight queries finish on the old snapshot, which is freed once the
+      last of them returns.  Stop the watcher with :meth:`close`, or use the
+      retriever as a context manager.
     """
 
     def __init__(
         self,
         dim: int = 384,
-        index_path: str | None = INDEX_PATH,
-        metadata_path: str | None = METADATA_PATH,
+        index_path: str | None = None,
+        metadata_path: str | None = None,
+        snapshot_dir: str | None = None,
+        reload_interval: float | None = None,
     ) -> None:
-        self.index: FaissIndex = FaissIndex(dim=dim)
-        self.index.load(index_path, metadata_path)
+        use_files = index_path is not None or metadata_path is not None
+        if use_files and (snapshot_dir is not None or reload_interval):
+            raise ValueError(
+                "index_path/metadata_path cannot be combined with snapshot_dir "
+                "or reload_interval"
+            )
+
+        self.dim = dim
+        self.snapshot_dir = None if use_files else (snapshot_dir or SNAPSHOT_DIR)
+        self.version: str | None = None
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: threading.Thread | None = None
+
+        if not self.reload():
+            if snapshot_dir is not None:
+                raise FileNotFoundError(f"No index snapshot published in {snapshot_dir!s}")
+            # Explicit flat files, or nothing published yet at SNAPSHOT_DIR.
+            index = FaissIndex(dim=dim)
+            index.load(index_path or INDEX_PATH, metadata_path or METADATA_PATH)
+            self.index: FaissIndex = index
+
+        if self.snapshot_dir and reload_interval:
+            self._watcher = threading.Thread(
+                target=self._watch,
+                args=(reload_interval,),
+                name="rag-snapshot-watcher",
+                daemon=True,
+            )
+            self._watcher.start()
+
+    # --------------------------------------------------------------------- #
+    # Snapshot management                                                   #
+    # --------------------------------------------------------------------- #
+    def reload(self) -> bool:
+        """Load the live snapshot if it differs from the one being served.
+
+        The new index is fully read into memory *before* it replaces
+        ``self.index``, so queries never block on disk I/O and never observe a
+        partially loaded index.
+
+        Returns
+        -------
+        bool
+            ``True`` if a new snapshot was swapped in, ``False`` otherwise.
+        """
+        if not self.snapshot_dir:
+            return False
+
+        with self._reload_lock:
+            version = current_version(self.snapshot_dir)
+            if version is None or version == self.version:
+                return False
+
+            index = load_snapshot(self.snapshot_dir, version, dim=self.dim)
+            # Single reference assignment: atomic for concurrent readers.
+            self.index = index
+            self.version = version
+
+        logger.info("Loaded index snapshot %s", version)
+        return True
+
+    def close(self) -> None:
+        """Stop the background watcher, if any."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def __enter__(self) -> RAGRetriever:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.reload()
+            except Exception:  # keep serving the current snapshot
+                logger.exception("Failed to reload index snapshot")
 
     # --------------------------------------------------------------------- #
     # Public API                                                            #
@@ -83,8 +196,12 @@ class RAGRetriever:
         >>> passages[0][0]["text"]
         'Paris est la capitale de la France …'
         """
-        # 1. Encode the query into the same latent space as the index.
+        # 1. Pin the snapshot for the whole query; a concurrent reload only
+        #    rebinds ``self.index`` and leaves this reference untouched.
+        index = self.index
+
+        # 2. Encode the query into the same latent space as the index.
         query_emb: np.ndarray = embed(query).reshape(1, -1)
 
-        # 2. Perform ANN search and return the results.
-        return self.index.search(query_emb, top_k=top_k)
+        # 3. Perform ANN search and return the results.
+        return index.search(query_emb, top_k=top_k)
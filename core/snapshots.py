@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+from .vector_store import FaissIndex
+
+# --------------------------------------------------------------------------- #
+# On-disk layout                                                              #
+# --------------------------------------------------------------------------- #
+#   <snapshot_dir>/
+#   ├── CURRENT                  # name of the live version (single line)
+#   └── versions/
+#       ├── 20250101T120000123456-a1b2c3/
+#       │   ├── faiss_index.index
+#       │   └── faiss_metadata.pkl
+#       └── ...
+#
+# A version directory is immutable once published.  Readers only ever follow
+# ``CURRENT``, which is swapped with ``os.replace`` so it always names a
+# complete snapshot.
+POINTER_FILE = "CURRENT"
+VERSIONS_DIR = "versions"
+INDEX_FILE = "faiss_index.index"
+METADATA_FILE = "faiss_metadata.pkl"
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory's entries (new or renamed files) to disk."""
+    if os.name == "nt":  # directories cannot be opened on Windows
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def snapshot_paths(snapshot_dir: str | Path, version: str) -> tuple[Path, Path]:
+    """Return the ``(index_path, metadata_path)`` pair of a published version.
+
+    Parameters
+    ----------
+    snapshot_dir
+        Root directory holding the ``CURRENT`` pointer and ``versions/``.
+    version
+        Name of a version directory, as returned by :func:`current_version`.
+    """
+    version_dir = Path(snapshot_dir) / VERSIONS_DIR / version
+    return version_dir / INDEX_FILE, version_dir / METADATA_FILE
+
+
+def current_version(snapshot_dir: str | Path) -> str | None:
+    """Read the name of the live snapshot.
+
+    Parameters
+    ----------
+    snapshot_dir
+        Root directory holding the ``CURRENT`` pointer.
+
+    Returns
+    -------
+    str or None
+        The version name, or ``None`` if nothing has been published yet.
+    """
+    try:
+        version = (Path(snapshot_dir) / POINTER_FILE).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    return version.strip() or None
+
+
+def list_versions(snapshot_dir: str | Path) -> List[str]:
+    """Return every published version name, oldest first."""
+    versions_dir = Path(snapshot_dir) / VERSIONS_DIR
+    if not versions_dir.is_dir():
+        return []
+    # Version names start with a UTC timestamp, so lexical order is age order.
+    return sorted(
+        p.name for p in versions_dir.iterdir()
+        if p.is_dir() and not p.name.startswith(".")
+    )
+
+
+def publish_snapshot(
+    index: FaissIndex,
+    snapshot_dir: str | Path,
+    keep: int = 3,
+) -> str:
+    """Write *index* as a new immutable version and make it the live one.
+
+    The snapshot is first saved into a hidden staging directory, renamed into
+    ``versions/`` once fully written, and only then advertised by atomically
+    replacing the ``CURRENT`` pointer.  A concurrent reader therefore sees
+    either the previous version or the new one—never a partial file.
+
+    Parameters
+    ----------
+    index
+        The populated :class:`~core.vector_store.FaissIndex` to persist.
+    snapshot_dir
+        Root directory holding the ``CURRENT`` pointer and ``versions/``.
+    keep
+        Number of most recent versions to retain on disk (the live one is
+        always kept).  Older versions are deleted after the switch.
+
+    Returns
+    -------
+    str
+        The name of the newly published version.
+    """
+    root = Path(snapshot_dir)
+    versions_dir = root / VERSIONS_DIR
+    versions_dir.mkdir(parents=True, exist_ok=True)
+
+    now = time.time()
+    version = (
+        f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime(now))}"
+        f"{int(now % 1 * 1e6):06d}-{uuid.uuid4().hex[:6]}"
+    )
+
+    # 1. Write the full snapshot out of sight of readers and make it durable
+    #    before anything can point at it.
+    staging = versions_dir / f".tmp-{version}"
+    staging.mkdir()
+    try:
+        index.save(staging / INDEX_FILE, staging / METADATA_FILE)
+        for name in (INDEX_FILE, METADATA_FILE):
+            with open(staging / name, "rb+") as handle:
+                os.fsync(handle.fileno())
+        _fsync_dir(staging)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    os.replace(staging, versions_dir / version)
+    _fsync_dir(versions_dir)
+
+    # 2. Flip the pointer atomically.
+    tmp_pointer = root / f".{POINTER_FILE}.{version}"
+    with open(tmp_pointer, "w", encoding="utf-8") as handle:
+        handle.write(version)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_pointer, root / POINTER_FILE)
+    _fsync_dir(root)
+
+    prune_snapshots(root, keep=keep)
+    return version
+
+
+def prune_snapshots(snapshot_dir: str | Path, keep: int = 3) -> List[str]:
+    """Delete all but the *keep* most recent versions.
+
+    The live version is never removed, even if it is not among the most
+    recent ones (e.g. after a manual rollback).
+
+    Returns
+    -------
+    list[str]
+        Names of the deleted versions.
+    """
+    live = current_version(snapshot_dir)
+    versions = list_versions(snapshot_dir)
+    stale = [v for v in versions[: max(len(versions) - keep, 0)] if v != live]
+    for version in stale:
+        shutil.rmtree(Path(snapshot_dir) / VERSIONS_DIR / version, ignore_errors=True)
+    return stale
+
+
+def load_snapshot(
+    snapshot_dir: str | Path,
+    version: str,
+    dim: int,
+) -> FaissIndex:
+    """Load a published version into a fresh :class:`FaissIndex`.
+
+    Parameters
+    ----------
+    snapshot_dir
+        Root directory holding ``versions/``.
+    version
+        Version name to load.
+    dim
+        Embedding dimensionality, forwarded to :class:`FaissIndex`.
+    """
+    index = FaissIndex(dim=dim)
+    index.load(*snapshot_paths(snapshot_dir, version))
+    return index
@@ -0,0 +1,80 @@
+# bench_chunker.py
+"""Compare the character splitter with the token-aware chunker.
+
+For each strategy the script reports throughput (characters per second) and
+the token length of the produced chunks, measured with the embedding
+tokenizer: chunks above the model limit are truncated by the embedder, while
+short chunks waste padding.
+
+    python -m rag.scripts.bench_chunker --workers 1 4
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from transformers import AutoTokenizer
+
+from ..core.config import PDF_DIR, EMBEDDING_MODEL_ID
+from ..core.loader import load_pdfs
+from ..core.chunker import chunk_texts, chunk_texts_by_tokens
+
+
+def _run(name, func, docs, repeat, tokenizer):
+    n_chars = sum(len(doc["text"]) for doc in docs)
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        chunks = func(docs)
+        timings.append(time.perf_counter() - t0)
+    best = min(timings)
+
+    # Length as seen by the embedder, special tokens included.
+    lengths = [
+        len(tokenizer(chunk["text"], verbose=False)["input_ids"]) for chunk in chunks
+    ]
+    limit = tokenizer.model_max_length
+    truncated = sum(length > limit for length in lengths)
+    mean = statistics.mean(lengths) if lengths else 0.0
+    print(
+        f"{name:<22} {best:>8.3f} s {n_chars / best / 1e6:>8.2f} Mchar/s "
+        f"{len(chunks):>8} {mean:>8.1f} {max(lengths, default=0):>6} "
+        f"{truncated:>10} {mean / limit:>7.0%}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdf-dir", default=PDF_DIR)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count()])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    docs = load_pdfs(args.pdf_dir)
+    tokenizer = AutoTokenizer.from_pretrained(EMBEDDING_MODEL_ID)
+    print(
+        f"{len(docs)} documents, {sum(len(d['text']) for d in docs)} caractères, "
+        f"limite du modèle : {tokenizer.model_max_length} tokens\n"
+    )
+    print(
+        f"{'stratégie':<22} {'temps':>10} {'débit':>16} {'chunks':>8} "
+        f"{'moy tok':>8} {'max':>6} {'tronqués':>10} {'remplis':>7}"
+    )
+
+    _run("caractères", chunk_texts, docs, args.repeat, tokenizer)
+    for workers in args.workers:
+        _run(
+            f"tokens ({workers} proc)",
+            # Force the pool so that worker counts can be compared.
+            lambda d, w=workers: chunk_texts_by_tokens(
+                d, workers=w, min_parallel_chars=0
+            ),
+            docs,
+            args.repeat,
+            tokenizer,
+        )
+
+
+if __name__ == "__main__":
+    main()
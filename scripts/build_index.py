@@ -1,13 +1,12 @@
 # build_index.py
 
 import logging
-from pathlib import Path
 from tqdm import tqdm
-from ..core.config import INDEX_PATH, METADATA_PATH, EMBEDDING_DIM
+from ..core.config import SNAPSHOT_DIR, SNAPSHOT_KEEP, EMBEDDING_DIM, CHUNK_MODE
 from ..core.loader import load_pdfs
-from ..core.chunker import chunk_texts
-from ..core.embedder import embed_chunks
+from ..core.chunker import chunk_texts, chunk_texts_by_tokens
 from ..core.vector_store import FaissIndex
+from ..core.snapshots import publish_snapshot
 
 
 logging.basicConfig(level=logging.INFO, format="✅ [%(levelname)s] %(message)s")
@@ -18,23 +17,28 @@ def main():
     docs = load_pdfs()
     
 
-    logger.info("Chunking...")
-    chunks = chunk_texts(docs)
+    logger.info("Chunking (%s)...", CHUNK_MODE)
+    if CHUNK_MODE == "tokens":
+        chunks = chunk_texts_by_tokens(docs)
+    else:
+        chunks = chunk_texts(docs)
 
     logger.info("Embedding des chunks...")
+    # Imported here: loading it loads the model, which the spawned chunking
+    # workers re-running this module must not do.
+    from ..core.embedder import embed_chunks
     embeddings = embed_chunks(chunks)
 
 
     logger.info("Construction de l'index FAISS...")
-    metadatas = [{"doc_id": chunk["doc_id"], "text": chunk["text"]} for chunk in chunks]
+    metadatas = [dict(chunk) for chunk in chunks]  # keeps pages and offsets when available
 
     index = FaissIndex(dim=embeddings.shape[1])
     index.add(embeddings, metadatas)
 
     logger.info("Sauvegarde...")
-    Path(INDEX_PATH).parent.mkdir(parents=True, exist_ok=True)
-    index.save(INDEX_PATH, METADATA_PATH)
-    logger.info("✅ Index sauvegardé avec succès.")
+    version = publish_snapshot(index, SNAPSHOT_DIR, keep=SNAPSHOT_KEEP)
+    logger.info("✅ Index sauvegardé avec succès (version %s).", version)
 
 
 if __name__ == "__main__":
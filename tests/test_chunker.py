@@ -0,0 +1,136 @@
+import random
+from bisect import bisect_right
+
+import pytest
+
+pytest.importorskip("langchain_text_splitters")
+transformers = pytest.importorskip("transformers")
+tokenizers = pytest.importorskip("tokenizers")
+
+from core.chunker import chunk_texts_by_tokens  # noqa: E402
+from core.config import EMBEDDING_MODEL_ID  # noqa: E402
+
+WORDS = (
+    "assurance contrat sinistre garantie véhicule habitation responsabilité "
+    "dommages indemnisation franchise assuré cotisation résiliation article"
+).split()
+SENTENCE_ENDS = ".!?"
+
+
+def make_doc(seed: int = 0, n_pages: int = 4):
+    """Pages of short paragraphs, joined like :func:`core.loader.load_pdfs`."""
+    rng = random.Random(seed)
+
+    def sentence():
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8)))
+        return words.capitalize() + rng.choice(SENTENCE_ENDS)
+
+    page_texts = [
+        "\n\n".join(
+            " ".join(sentence() for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(4, 8))
+        )
+        for _ in range(n_pages)
+    ]
+    pages, offset = [], 0
+    for number, page_text in enumerate(page_texts, start=1):
+        pages.append((number, offset))
+        offset += len(page_text) + 1
+    return {"doc_id": f"doc-{seed}.pdf", "text": "\n".join(page_texts), "pages": pages}
+
+
+@pytest.fixture(scope="module")
+def metaspace_tokenizer(tmp_path_factory):
+    """SentencePiece-like tokenizer whose spans include the leading whitespace.
+
+    It is saved with truncation and padding enabled, as some exported
+    ``tokenizer.json`` files are.
+    """
+    from tokenizers import (
+        Tokenizer,
+        models,
+        normalizers,
+        pre_tokenizers,
+        processors,
+        trainers,
+    )
+    from transformers import PreTrainedTokenizerFast
+
+    backend = Tokenizer(models.BPE(unk_token="<unk>"))
+    backend.normalizer = normalizers.Replace("\n", " ")
+    backend.pre_tokenizer = pre_tokenizers.Metaspace()
+    backend.train_from_iterator(
+        [make_doc(seed)["text"] for seed in range(20)],
+        trainers.BpeTrainer(vocab_size=300, special_tokens=["<unk>", "<s>", "</s>", "<pad>"]),
+    )
+    backend.post_processor = processors.TemplateProcessing(
+        single="<s> $A </s>", special_tokens=[("<s>", 1), ("</s>", 2)]
+    )
+    backend.enable_truncation(max_length=48)
+    backend.enable_padding(pad_id=3, pad_token="<pad>", length=48)
+
+    path = tmp_path_factory.mktemp("metaspace")
+    PreTrainedTokenizerFast(
+        tokenizer_object=backend,
+        model_max_length=48,
+        unk_token="<unk>",
+        bos_token="<s>",
+        eos_token="</s>",
+        pad_token="<pad>",
+    ).save_pretrained(path)
+    return str(path)
+
+
+@pytest.fixture(params=["configured", "metaspace"])
+def tokenizer_id(request):
+    if request.param == "metaspace":
+        return request.getfixturevalue("metaspace_tokenizer")
+    try:
+        transformers.AutoTokenizer.from_pretrained(EMBEDDING_MODEL_ID)
+    except OSError:
+        pytest.skip(f"{EMBEDDING_MODEL_ID} is not available offline")
+    return EMBEDDING_MODEL_ID
+
+
+def expected_page(doc, char):
+    starts = [offset for _, offset in doc["pages"]]
+    return doc["pages"][bisect_right(starts, char) - 1][0]
+
+
+def test_chunks_fit_and_follow_boundaries(tokenizer_id):
+    tokenizer = transformers.AutoTokenizer.from_pretrained(tokenizer_id)
+    doc = make_doc(seed=123, n_pages=6)
+    text = doc["text"]
+    budget = tokenizer.model_max_length - tokenizer.num_special_tokens_to_add()
+
+    chunks = chunk_texts_by_tokens([doc], tokenizer_id=tokenizer_id, workers=1)
+    assert len(chunks) > 3
+
+    for chunk in chunks:
+        start, end = chunk["start_char"], chunk["end_char"]
+        assert chunk["text"] == text[start:end] == text[start:end].strip()
+        assert chunk["n_tokens"] <= budget
+        n_model_tokens = len(tokenizer(chunk["text"], truncation=False)["input_ids"])
+        assert n_model_tokens <= tokenizer.model_max_length
+        assert chunk["page_start"] == expected_page(doc, start)
+        assert chunk["page_end"] == expected_page(doc, end - 1)
+
+    # The whole document is covered: nothing but whitespace between chunks,
+    # and the last chunk reaches the end (no truncation of the document).
+    assert not text[: chunks[0]["start_char"]].strip()
+    assert chunks[-1]["end_char"] == len(text.rstrip())
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert not text[prev["end_char"] : nxt["start_char"]].strip()
+
+    # Sentences are much shorter than the budget, so every cut is at a
+    # sentence end or stronger, and every chunk starts at a sentence start.
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert prev["text"][-1] in SENTENCE_ENDS
+        assert text[: nxt["start_char"]].rstrip()[-1] in SENTENCE_ENDS
+    assert any(text.startswith("\n\n", c["end_char"]) for c in chunks[:-1])
+    assert any(nxt["start_char"] < prev["end_char"] for prev, nxt in zip(chunks, chunks[1:]))
+
+
+def test_max_tokens_above_model_limit_is_rejected(metaspace_tokenizer):
+    with pytest.raises(ValueError, match="maximum sequence length"):
+        chunk_texts_by_tokens([make_doc()], tokenizer_id=metaspace_tokenizer, max_tokens=1024)